@@ -1,2 +1,2 @@
-__all__ = ["io_loader", "model_core", "solve", "cli"]
+__all__ = ["io_loader", "model_core", "solve", "cli", "contingency"]
 __version__ = "0.1.0"
@@ -34,11 +34,13 @@ Dependencies
 - pyomo
 - pyyaml
 - pydessem.solve
+- pydessem.contingency
 
 """
 
 import argparse, json
 from .solve import solve_case
+from .contingency import solve_n1
 
 def main():
     """
@@ -66,6 +68,13 @@ def main():
     --json : bool, optional
         If specified, prints the result in JSON format.
         Otherwise, prints a summarized output to the terminal.
+    --n1 : bool, optional
+        If specified, screens the dispatch against single line outages
+        and re-solves with the violated security constraints
+        (see ``pydessem.contingency.solve_n1``).
+        With ``--json``, an ``"n1"`` entry summarizes the screening
+        (violations, checked triples, iterations, convergence and
+        islanding outages).
 
     Returns
     -------
@@ -108,14 +117,36 @@ def main():
     p.add_argument("yaml", help="Caminho para o arquivo YAML do caso.")
     p.add_argument("--solver", default="glpk", help="Nome do solver (glpk, cbc, gurobi, cplex, ...)")
     p.add_argument("--json", action="store_true", help="Imprime resultado em JSON.")
+    p.add_argument("--n1", action="store_true", help="Aplica a triagem de contingências N-1 (LODF).")
     args = p.parse_args()
 
-    out, m, data = solve_case(args.yaml, solver_name=args.solver)
+    report = None
+    if args.n1:
+        out, m, data, report = solve_n1(args.yaml, solver_name=args.solver)
+    else:
+        out, m, data = solve_case(args.yaml, solver_name=args.solver)
     if args.json:
-        print(json.dumps(out, indent=2, ensure_ascii=False))
+        # Chaves (índice, t) viram texto, ex.: "('G1', 1)"
+        payload = {k: {str(i): v for i, v in s.items()} if isinstance(s, dict) else s
+                   for k, s in out.items()}
+        if report is not None:
+            payload["n1"] = {
+                "violations": int(len(report["hour"])),
+                "checked": int(report["checked"]),
+                "iterations": int(report["iterations"]),
+                "converged": bool(report["converged"]),
+                "islanding": list(report["islanding"]),
+            }
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
     else:
         print("Objetivo:", out["objective"])
         print("Geração (P[g,t]) - primeiros 10:")
         for i, ((g,t), v) in enumerate(out["P"].items()):
             if i >= 10: break
             print(f"  {g:>4s} t={t}: {v:.2f}")
+        if report is not None:
+            print(f"Violações N-1: {len(report['hour'])} "
+                  f"(re-soluções: {report['iterations']}, "
+                  f"convergiu: {'sim' if report['converged'] else 'não'})")
+            print(f"Contingências radiais não verificadas (ilhamento): "
+                  f"{len(report['islanding'])}")
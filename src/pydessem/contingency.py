@@ -0,0 +1,360 @@
+"""
+PyDessem Contingency Screening
+==============================
+
+N-1 line outage screening based on distribution factors.
+
+Summary
+-------
+This module checks a solved dispatch against every single line outage
+without rebuilding the Pyomo model per outage. Power transfer (PTDF) and
+line outage distribution factors (LODF) are computed once from the DC
+network topology and cached. Post-contingency flows
+
+    F_post[l, k, t] = F[l, t] + LODF[l, k] * F[k, t]
+
+are then evaluated for all (monitored line, outage, hour) triples as
+batched array operations, in chunks that bound memory usage. Only the
+violated security constraints are added back to the model for a re-solve.
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Contents
+--------
+- network_factors: cached PTDF/LODF matrices of the case network.
+- screen_n1: evaluate post-contingency flows and report violations.
+- add_security_constraints: add violated N-1 constraints to a model.
+- solve_n1: solve, screen and re-solve until the dispatch is N-1 secure.
+
+Notes
+-----
+This module is part of the activities of the discipline
+EELT7030 - Planejamento da Operação Eletroenergética de Médio/Curto Prazo,
+Federal University of Paraná (UFPR), Brazil.
+
+Dependencies
+------------
+- functools
+- numpy
+- pyomo.environ
+- pyomo.opt
+- pydessem.io_loader
+- pydessem.model_core
+- pydessem.reporting
+- pydessem.solve
+"""
+
+from functools import lru_cache
+import numpy as np
+from pyomo.environ import ConstraintList, SolverFactory
+from pyomo.opt import TerminationCondition
+from .io_loader import load_case
+from .model_core import build_model
+from .reporting import series_to_array, result_arrays, bus_hour_totals
+from .solve import collect_results
+
+def _topology_key(data):
+    """Hashable description of the DC network used as cache key."""
+    line_data = data["map"]["line_data"]
+    lines = tuple((ell["name"], ell["i"], ell["j"], float(line_data[ell["name"]]["b"]))
+                  for ell in data["sets"]["L"])
+    return tuple(data["sets"]["B"]), lines, data["params"]["ref_bus"]
+
+@lru_cache(maxsize=16)
+def _factors(key):
+    """PTDF/LODF computation for a topology key (cached)."""
+    B, lines, ref = key
+    pos = {b: k for k, b in enumerate(B)}
+    nL, nB = len(lines), len(B)
+    rows = np.arange(nL)
+    A = np.zeros((nL, nB))
+    A[rows, [pos[i] for _, i, _, _ in lines]] = 1.0
+    A[rows, [pos[j] for _, _, j, _ in lines]] = -1.0
+    b = np.array([bl for _, _, _, bl in lines])
+
+    # Matriz B reduzida (sem a barra de referência) fatorada uma única vez
+    keep = np.array([k for k in range(nB) if B[k] != ref], dtype=np.intp)
+    Ar = A[:, keep]
+    Bbus = Ar.T @ (b[:, None] * Ar)
+    try:
+        X = np.linalg.solve(Bbus, Ar.T * b)
+    except np.linalg.LinAlgError as exc:
+        raise ValueError("Rede desconexa: matriz B singular.") from exc
+    ptdf = np.zeros((nL, nB))
+    ptdf[:, keep] = X.T
+
+    # M[l, k]: fluxo em l por transferência unitária de i_k para j_k
+    M = ptdf @ A.T
+    denom = 1.0 - np.diag(M)
+    island = np.abs(denom) < 1e-9
+    lodf = M / np.where(island, 1.0, denom)[None, :]
+    lodf[rows, rows] = -1.0
+    lodf[:, island] = np.nan
+
+    for a in (ptdf, lodf, island):
+        a.setflags(write=False)
+    return {
+        "buses": list(B),
+        "lines": [name for name, _, _, _ in lines],
+        "ptdf": ptdf,
+        "lodf": lodf,
+        "islanding": island,
+    }
+
+def network_factors(data):
+    """
+    Compute the PTDF and LODF matrices of the case network.
+
+    The reduced nodal susceptance matrix is factorized once per network
+    topology and the resulting factors are cached, so repeated screenings
+    of the same case (e.g. in `solve_n1`) do not recompute them.
+
+    Parameters
+    ----------
+    data : dict
+        Case data loaded with `load_case`. Uses ``sets.B``, ``sets.L``,
+        ``map.line_data[*].b`` and ``params.ref_bus``.
+
+    Returns
+    -------
+    dict
+        - ``"buses"``, ``"lines"`` : labels in the row/column order.
+        - ``"ptdf"`` : array ``(L, B)``, flow change on each line per MW
+          injected at each bus and withdrawn at the reference bus.
+        - ``"lodf"`` : array ``(L, L)``, ``lodf[l, k]`` is the fraction of
+          the pre-outage flow of line ``k`` shifted to line ``l`` when
+          ``k`` is out. Columns of islanding outages are NaN.
+        - ``"islanding"`` : boolean array ``(L,)``, outages that split the
+          network (radial lines).
+
+    Raises
+    ------
+    ValueError
+        If the network is disconnected.
+
+    Notes
+    -----
+    The returned arrays are shared by the cache and are read-only.
+    """
+    return _factors(_topology_key(data))
+
+def _ratings(data, lines):
+    """Post-contingency line ratings (``fmax_n1``, defaulting to ``fmax``)."""
+    line_data = data["map"]["line_data"]
+    return np.array([float(line_data[ell].get("fmax_n1", line_data[ell]["fmax"]))
+                     for ell in lines])
+
+def screen_n1(out, data, outages=None, monitored=None, tol=1e-6,
+              chunk_bytes=64 * 2**20):
+    """
+    Screen a solved dispatch against all single line outages.
+
+    Parameters
+    ----------
+    out : dict
+        Results dictionary returned by `solve_case`. Base-case flows are
+        taken from ``out["F"]``; when absent they are computed from the
+        nodal injections (``P``, ``LS`` and demand) through the PTDF.
+    data : dict
+        Case data loaded with `load_case`.
+    outages : sequence of str, optional
+        Lines taken out of service. Default is every line.
+    monitored : sequence of str, optional
+        Lines whose post-contingency flow is checked. Default is every line.
+    tol : float, optional
+        Tolerance (MW) above the rating before a flow counts as a violation.
+    chunk_bytes : int, optional
+        Upper bound on the memory of each block of post-contingency
+        flows, counting the temporaries of the limit check (17 bytes per
+        (monitored, outage, hour) element). Monitored lines, outages and
+        hours are all chunked; blocks never go below one element.
+        Default is 64 MiB.
+
+    Returns
+    -------
+    dict
+        - ``"monitored"``, ``"outage"`` : line labels of each violation.
+        - ``"hour"`` : hour (1-based) of each violation.
+        - ``"flow"``, ``"limit"``, ``"loading"`` : post-contingency flow,
+          rating and loading (%) of each violation.
+        - ``"islanding"`` : outages skipped because they split the network.
+        - ``"checked"`` : number of (monitored, outage, hour) triples checked.
+
+    Notes
+    -----
+    Post-contingency ratings come from ``map.line_data[*].fmax_n1`` when
+    present, otherwise from ``fmax``.
+
+    Examples
+    --------
+    ``examples/case_tiny.yaml`` is radial: every outage islands the
+    network, so nothing is checked. An empty violation list only means
+    "secure" when ``report["checked"] > 0``.
+
+    >>> from pydessem.io_loader import load_case
+    >>> from pydessem.contingency import screen_n1
+    >>> data = load_case("examples/case_tiny.yaml")
+    >>> out = {"F": {(ell, t): 0.0 for ell in ("L12", "L23") for t in range(1, 7)}}
+    >>> report = screen_n1(out, data)
+    >>> report["islanding"], report["checked"]
+    (['L12', 'L23'], 0)
+    """
+    fac = network_factors(data)
+    lines = fac["lines"]
+    pos = {ell: k for k, ell in enumerate(lines)}
+    T = int(data["meta"]["horizon_hours"])
+
+    if "F" in out:
+        F = series_to_array(out["F"], lines, T)
+    else:
+        inj = bus_hour_totals(result_arrays(out, data), data)["injection"]
+        F = fac["ptdf"] @ inj
+
+    mon = np.array([pos[ell] for ell in (lines if monitored is None else monitored)],
+                   dtype=np.intp)
+    cand = [pos[ell] for ell in (lines if outages is None else outages)]
+    island = [k for k in cand if fac["islanding"][k]]
+    ks = np.array([k for k in cand if not fac["islanding"][k]], dtype=np.intp)
+
+    lim = _ratings(data, lines)[mon]
+    Fm = F[mon]
+    lodf = fac["lodf"][np.ix_(mon, ks)]
+    nM, nK = len(mon), len(ks)
+
+    # Blocos (monitoradas x contingências x horas) limitados em memória:
+    # por elemento, fluxo e |fluxo| em float64 (8 + 8) e a máscara (1)
+    max_elems = max(1, chunk_bytes // 17)
+    mc = max(1, min(nM, max_elems))
+    tc = max(1, min(T, max_elems // mc))
+    kc = max(1, min(nK, max_elems // (mc * tc)))
+
+    found = {"m": [], "k": [], "t": [], "flow": []}
+    for m0 in range(0, nM, mc):
+        mm = slice(m0, m0 + mc)
+        thr = (lim[mm] + tol)[:, None, None]
+        for k0 in range(0, nK, kc):
+            kk = slice(k0, k0 + kc)
+            Fk = F[ks[kk]]
+            for t0 in range(0, T, tc):
+                tt = slice(t0, t0 + tc)
+                post = lodf[mm, kk, None] * Fk[None, :, tt]
+                post += Fm[mm, None, tt]
+                li, ki, ti = np.nonzero(np.abs(post) > thr)
+                if li.size:
+                    found["m"].append(li + m0)
+                    found["k"].append(ki + k0)
+                    found["t"].append(ti + t0)
+                    found["flow"].append(post[li, ki, ti])
+
+    cat = {k: np.concatenate(v) if v else np.zeros(0, dtype=np.intp if k != "flow" else float)
+           for k, v in found.items()}
+    names = np.asarray(lines, dtype=object)
+    limit = lim[cat["m"]]
+    return {
+        "monitored": names[mon[cat["m"]]],
+        "outage": names[ks[cat["k"]]],
+        "hour": cat["t"] + 1,
+        "flow": cat["flow"],
+        "limit": limit,
+        "loading": 100.0 * np.abs(cat["flow"]) / limit,
+        "islanding": [lines[k] for k in island],
+        "checked": nM * nK * T,
+    }
+
+def add_security_constraints(m, data, report):
+    """
+    Add the N-1 constraints violated in a screening report to a model.
+
+    For each violation, the constraint
+
+        -limit <= F[l, t] + LODF[l, k] * F[k, t] <= limit
+
+    is appended to the ``m.SecurityN1`` constraint list, which is created
+    on first use.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model built by `build_model`.
+    data : dict
+        Case data loaded with `load_case`.
+    report : dict
+        Report returned by `screen_n1`.
+
+    Returns
+    -------
+    int
+        Number of constraints added.
+    """
+    fac = network_factors(data)
+    pos = {ell: k for k, ell in enumerate(fac["lines"])}
+    if not hasattr(m, "SecurityN1"):
+        m.SecurityN1 = ConstraintList()
+    n = 0
+    for ell, k, t, lim in zip(report["monitored"], report["outage"],
+                              report["hour"], report["limit"]):
+        coef = float(fac["lodf"][pos[ell], pos[k]])
+        t = int(t)
+        m.SecurityN1.add((-float(lim), m.F[ell, t] + coef * m.F[k, t], float(lim)))
+        n += 1
+    return n
+
+def solve_n1(path_yaml, solver_name="glpk", max_iter=5, **kwargs):
+    """
+    Solve a case and iteratively enforce N-1 line security.
+
+    The case is solved, screened with `screen_n1`, and the violated
+    security constraints are added to the same model before re-solving,
+    until no violation remains or `max_iter` re-solves are reached.
+    Radial outages are skipped by the screening and listed in the
+    report's ``"islanding"`` entry.
+
+    Parameters
+    ----------
+    path_yaml : str
+        Path to the YAML file describing the case.
+    solver_name : str, optional
+        Name of the solver to be used. Default is "glpk".
+    max_iter : int, optional
+        Maximum number of re-solves. Default is 5.
+    **kwargs
+        Extra arguments forwarded to `screen_n1`.
+
+    Returns
+    -------
+    tuple
+        (out, model, data, report), as in `solve_case`, plus the last
+        screening report with the additional entries ``"iterations"``
+        (number of re-solves performed) and ``"converged"`` (``False``
+        when `max_iter` was reached with violations left).
+
+    Raises
+    ------
+    RuntimeError
+        If a solve does not terminate with an optimal solution (e.g. the
+        added security constraints make the case infeasible).
+    """
+    data = load_case(path_yaml)
+    m = build_model(data)
+    opt = SolverFactory(solver_name)
+
+    it = 0
+    while True:
+        res = opt.solve(m, tee=False)
+        cond = res.solver.termination_condition
+        if cond != TerminationCondition.optimal:
+            raise RuntimeError(
+                f"Solver terminou sem solução ótima ({cond}) "
+                f"após {it} re-solução(ões) N-1."
+            )
+        out = collect_results(m)
+        report = screen_n1(out, data, **kwargs)
+        if len(report["hour"]) == 0 or it >= max_iter:
+            break
+        add_security_constraints(m, data, report)
+        it += 1
+    report["iterations"] = it
+    report["converged"] = len(report["hour"]) == 0
+    return out, m, data, report
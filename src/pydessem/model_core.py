@@ -231,31 +231,32 @@ def build_model(d: dict):
     # PWL por reservatório
     m.PWL = ConstraintList()
     # Entrada: d["params"]["hydro_pwl"][r] = list of {"q":..,"p":..}
+    qpts = {r: [pt["q"] for pt in d["params"]["hydro_pwl"][r]] for r in d["sets"]["R"]}
+    ppts = {r: [pt["p"] for pt in d["params"]["hydro_pwl"][r]] for r in d["sets"]["R"]}
+    # Interp linear simples (f_rule de Piecewise indexado: model, r, t, q)
+    def f_rule(model, r, t, q):
+        import bisect
+        qs, ps = qpts[r], ppts[r]
+        if q <= qs[0]: return ps[0]
+        if q >= qs[-1]: return ps[-1]
+        k = bisect.bisect_left(qs, q)
+        q0,q1 = qs[k-1], qs[k]
+        p0,p1 = ps[k-1], ps[k]
+        lam = (q - q0) / (q1 - q0) if q1!=q0 else 0.0
+        return p0 + lam*(p1 - p0)
+    # Q_t não tem limite superior na variável; a representação CC já
+    # restringe a vazão ao intervalo dos pontos da curva
+    m.HydroPWL = Piecewise(
+        m.R, m.T,
+        m.P_h, m.Q_t,
+        pw_pts={(r, t): qpts[r] for r in d["sets"]["R"] for t in range(1, T+1)},
+        f_rule=f_rule,
+        pw_constr_type="EQ",
+        pw_repn="CC",
+        unbounded_domain_var=True
+    )
+    # Vincula soma das GUs hidro do reservatório à potência PWL
     for r in d["sets"]["R"]:
-        pts = d["params"]["hydro_pwl"][r]
-        qpts = [pt["q"] for pt in pts]
-        ppts = [pt["p"] for pt in pts]
-        # Closure para interp linear
-        def f_rule(q, qpts=qpts, ppts=ppts):
-            # interp linear simples
-            import bisect
-            if q <= qpts[0]: return ppts[0]
-            if q >= qpts[-1]: return ppts[-1]
-            k = bisect.bisect_left(qpts, q)
-            q0,q1 = qpts[k-1], qpts[k]
-            p0,p1 = ppts[k-1], ppts[k]
-            lam = (q - q0) / (q1 - q0) if q1!=q0 else 0.0
-            return p0 + lam*(p1 - p0)
-        for t in range(1, T+1):
-            Piecewise(
-                m,
-                m.P_h[r,t], m.Q_t[r,t],
-                pw_pts=qpts,
-                f_rule=f_rule,
-                pw_constr_type="EQ",
-                pw_repn="CC"
-            )
-        # Vincula soma das GUs hidro do reservatório à potência PWL
         for t in range(1, T+1):
             m.PWL.add(sum(m.P[g,t] for g in m.GH if res_of_gen[g]==r) == m.P_h[r,t])
 
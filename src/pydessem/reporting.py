@@ -6,8 +6,12 @@ Post-processing utilities for PyDessem results.
 
 Summary
 -------
-This module provides basic functions for summarizing
-and presenting results from PyDessem simulations.
+This module provides functions for summarizing and presenting
+results from PyDessem simulations. The result series returned by
+`solve_case` are converted once into dense ``(entity, time)`` arrays,
+and every system-level summary is computed with array operations over
+those arrays and the case parameters, so that cases with millions of
+result entries can be reported quickly.
 
 Author
 ------
@@ -16,6 +20,16 @@ Augusto Mathias Adams <augusto.adams@ufpr.br>
 Contents
 --------
 - summarize_dispatch: group generation by unit and time.
+- series_to_array: convert a ``{(entity, t): value}`` series to an array.
+- result_arrays: convert all result series of a case to arrays.
+- bus_hour_totals: generation, demand, shedding and injection per bus and hour.
+- hydro_thermal_share: hydro vs thermal generation and shares.
+- cost_breakdown: objective split into its cost components.
+- reservoir_trajectories: reservoir volumes including the initial state.
+- line_loading_percentiles: percentiles of line loading over the horizon.
+- system_summary: all of the above in a single dictionary.
+- downsample: block aggregation of long horizons for plotting.
+- plot_dispatch, plot_reservoirs, plot_line_loading: plotting helpers.
 
 Notes
 -----
@@ -26,9 +40,12 @@ Federal University of Paraná (UFPR), Brazil.
 Dependencies
 ------------
 - collections
+- numpy
+- matplotlib (optional, plotting helpers only)
 """
 
 from collections import defaultdict
+import numpy as np
 
 def summarize_dispatch(out):
     """
@@ -57,3 +74,491 @@ def summarize_dispatch(out):
     for (g, t), val in P.items():
         per_gen[g].append((t, val))
     return {g: sorted(vals) for g, vals in per_gen.items()}
+
+def series_to_array(series, labels, T):
+    """
+    Convert a result series into a dense ``(entity, time)`` array.
+
+    Parameters
+    ----------
+    series : dict
+        Mapping ``(label, t) -> value`` with ``t`` in ``1..T``, as
+        produced by `solve_case`.
+    labels : sequence
+        Entity labels defining the row order of the array.
+    T : int
+        Number of time steps in the horizon.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(len(labels), T)``. Missing entries are zero.
+
+    Raises
+    ------
+    ValueError
+        If the series references a label not present in `labels`,
+        or a time step outside ``1..T``.
+
+    Examples
+    --------
+    >>> series_to_array({("G1", 1): 5.0, ("G1", 2): 7.0}, ["G1"], 2)
+    array([[5., 7.]])
+    """
+    labels = list(labels)
+    arr = np.zeros((len(labels), T))
+    if not series or not labels:
+        return arr
+    names, hours = zip(*series.keys())
+    names = np.asarray(names)
+    lab = np.asarray(labels)
+    order = np.argsort(lab, kind="stable")
+    pos = np.searchsorted(lab[order], names).clip(0, len(labels) - 1)
+    rows = order[pos]
+    if not np.array_equal(lab[rows], names):
+        raise ValueError("Série de resultados contém rótulos desconhecidos.")
+    cols = np.asarray(hours, dtype=np.intp) - 1
+    if cols.min() < 0 or cols.max() >= T:
+        raise ValueError(f"Série de resultados contém horas fora de 1..{T}.")
+    arr[rows, cols] = np.fromiter(series.values(), dtype=float, count=len(series))
+    return arr
+
+def result_arrays(out, data):
+    """
+    Convert all result series of a solved case into dense arrays.
+
+    Parameters
+    ----------
+    out : dict
+        Results dictionary returned by `solve_case`.
+    data : dict
+        Case data loaded with `load_case`.
+
+    Returns
+    -------
+    dict
+        Dictionary with the horizon ``"T"``, the case sets (``"B"``,
+        ``"G"``, ``"GH"``, ``"GT"``, ``"R"``, ``"L"``) and one array per
+        result series present in `out` (``"P"``, ``"LS"``, ``"F"``,
+        ``"V"``, ``"Q_t"``, ``"Q_s"``, ``"P_h"``, ``"u"``, ``"y"``,
+        ``"z"``), rows ordered as in the case sets. The reserve series
+        ``out["R"]`` is stored under ``"Rg"``, since ``"R"`` holds the
+        reservoir labels.
+
+    Notes
+    -----
+    The returned dictionary is the input of the remaining summary
+    functions of this module, so the conversion is paid only once.
+    """
+    T = int(data["meta"]["horizon_hours"])
+    s = data["sets"]
+    arr = {
+        "T": T,
+        "B": list(s["B"]),
+        "G": list(s["G"]),
+        "GH": list(s["GH"]),
+        "GT": list(s["GT"]),
+        "R": list(s["R"]),
+        "L": [ell["name"] for ell in s["L"]],
+    }
+    # chave em `out` -> (chave em `arr`, conjunto das linhas)
+    rows = {
+        "P": ("P", "G"), "LS": ("LS", "B"), "F": ("F", "L"),
+        "V": ("V", "R"), "Q_t": ("Q_t", "R"), "Q_s": ("Q_s", "R"),
+        "P_h": ("P_h", "R"), "R": ("Rg", "GT"),
+        "u": ("u", "GT"), "y": ("y", "GT"), "z": ("z", "GT"),
+    }
+    for key, (name, rset) in rows.items():
+        if key in out:
+            arr[name] = series_to_array(out[key], arr[rset], T)
+    return arr
+
+def _param_vector(values, labels, default=0.0):
+    """Vector of a per-entity parameter following the order of `labels`."""
+    return np.array([float(values.get(k, default)) for k in labels])
+
+def _demand_array(data, B, T):
+    """Demand array of shape ``(len(B), T)``."""
+    dem = data["params"]["demand"]
+    return np.array([dem[b][:T] for b in B], dtype=float).reshape(len(B), T)
+
+def _incidence(rows, cols, mapping):
+    """0/1 matrix with ``M[i, j] = 1`` when ``mapping[cols[j]] == rows[i]``."""
+    pos = {r: i for i, r in enumerate(rows)}
+    M = np.zeros((len(rows), len(cols)))
+    idx = [(pos[mapping[c]], j) for j, c in enumerate(cols) if c in mapping]
+    if idx:
+        i, j = zip(*idx)
+        M[list(i), list(j)] = 1.0
+    return M
+
+def bus_hour_totals(arr, data):
+    """
+    Compute generation, demand, load shedding and injection per bus and hour.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+    data : dict
+        Case data loaded with `load_case`.
+
+    Returns
+    -------
+    dict
+        - ``"generation"``, ``"demand"``, ``"load_shed"``, ``"injection"`` :
+          arrays of shape ``(B, T)``, where injection is
+          ``generation + load_shed - demand``.
+        - ``"system"`` : dict with the same keys summed over buses,
+          arrays of shape ``(T,)``.
+        - ``"total"`` : dict with the same keys summed over buses and time.
+    """
+    B, T = arr["B"], arr["T"]
+    A = _incidence(B, arr["G"], data["map"]["gen_bus"])
+    res = {
+        "generation": A @ arr["P"],
+        "demand": _demand_array(data, B, T),
+        "load_shed": arr["LS"],
+    }
+    res["injection"] = res["generation"] + res["load_shed"] - res["demand"]
+    res["system"] = {k: v.sum(axis=0) for k, v in res.items()}
+    res["total"] = {k: float(v.sum()) for k, v in res["system"].items()}
+    return res
+
+def hydro_thermal_share(arr):
+    """
+    Compute hydro and thermal generation and their share of the total.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+
+    Returns
+    -------
+    dict
+        - ``"hydro"``, ``"thermal"`` : generation per hour, shape ``(T,)``.
+        - ``"hydro_share"``, ``"thermal_share"`` : fraction of the hourly
+          generation, zero in hours without generation.
+        - ``"total"`` : dict with horizon totals and shares.
+    """
+    G = arr["G"]
+    pos = {g: i for i, g in enumerate(G)}
+    P = arr["P"]
+    hydro = P[[pos[g] for g in arr["GH"]]].sum(axis=0)
+    thermal = P[[pos[g] for g in arr["GT"]]].sum(axis=0)
+    gen = hydro + thermal
+    with np.errstate(invalid="ignore", divide="ignore"):
+        h_share = np.where(gen > 0, hydro / gen, 0.0)
+    h_tot, t_tot = float(hydro.sum()), float(thermal.sum())
+    g_tot = h_tot + t_tot
+    return {
+        "hydro": hydro,
+        "thermal": thermal,
+        "hydro_share": h_share,
+        "thermal_share": np.where(gen > 0, 1.0 - h_share, 0.0),
+        "total": {
+            "hydro": h_tot,
+            "thermal": t_tot,
+            "hydro_share": h_tot / g_tot if g_tot > 0 else 0.0,
+            "thermal_share": t_tot / g_tot if g_tot > 0 else 0.0,
+        },
+    }
+
+def cost_breakdown(arr, data):
+    """
+    Split the objective function into its cost components.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`. Commitment (``"u"``, ``"y"``,
+        ``"z"``) and reserve (``"Rg"``) arrays are required.
+    data : dict
+        Case data loaded with `load_case`.
+
+    Returns
+    -------
+    dict
+        - ``"per_hour"`` : dict mapping each component (``"variable"``,
+          ``"no_load"``, ``"startup"``, ``"shutdown"``, ``"reserve"``,
+          ``"load_shed"``, ``"spill"``) to an array of shape ``(T,)``.
+        - ``"total"`` : dict mapping each component to its horizon cost.
+        - ``"objective"`` : sum of all components, which matches the
+          objective value of the solved model.
+    """
+    prm = data["params"]
+    GT = arr["GT"]
+    uc = prm.get("uc", {})
+    pos = {g: i for i, g in enumerate(arr["G"])}
+    PT = arr["P"][[pos[g] for g in GT]]
+    pen = prm["penalties"]
+    per_hour = {
+        "variable": _param_vector(prm["therm_cost"], GT) @ PT,
+        "no_load": _param_vector(uc.get("no_load_cost", {}), GT) @ arr["u"],
+        "startup": _param_vector(uc.get("startup_cost", {}), GT) @ arr["y"],
+        "shutdown": _param_vector(uc.get("shutdown_cost", {}), GT) @ arr["z"],
+        "reserve": _param_vector(prm.get("reserves", {}).get("cost", {}), GT) @ arr["Rg"],
+        "load_shed": float(pen["load_shed"]) * arr["LS"].sum(axis=0),
+        "spill": float(pen["spill"]) * arr["Q_s"].sum(axis=0),
+    }
+    total = {k: float(v.sum()) for k, v in per_hour.items()}
+    return {"per_hour": per_hour, "total": total, "objective": sum(total.values())}
+
+def reservoir_trajectories(arr, data):
+    """
+    Build reservoir volume trajectories including the initial volume.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+    data : dict
+        Case data loaded with `load_case`.
+
+    Returns
+    -------
+    dict
+        - ``"volume"`` : array of shape ``(R, T + 1)``, column 0 is ``vol0``.
+        - ``"useful_fraction"`` : ``(V - Vmin) / (Vmax - Vmin)``, same shape.
+        - ``"turbined"``, ``"spilled"`` : arrays of shape ``(R, T)``.
+        - ``"delta"`` : final minus initial volume, shape ``(R,)``.
+    """
+    prm = data["params"]
+    R = arr["R"]
+    v0 = _param_vector(prm["vol0"], R)
+    vmin = _param_vector(prm["vol_min"], R)
+    vmax = _param_vector(prm["vol_max"], R)
+    vol = np.hstack([v0[:, None], arr["V"]])
+    span = vmax - vmin
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.where(span[:, None] > 0, (vol - vmin[:, None]) / span[:, None], 0.0)
+    return {
+        "volume": vol,
+        "useful_fraction": frac,
+        "turbined": arr["Q_t"],
+        "spilled": arr["Q_s"],
+        "delta": vol[:, -1] - vol[:, 0],
+    }
+
+def line_loading_percentiles(arr, data, q=(50, 90, 95, 99, 100)):
+    """
+    Compute line loading percentiles over the horizon.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+    data : dict
+        Case data loaded with `load_case`.
+    q : sequence of float, optional
+        Percentiles to compute. Default is ``(50, 90, 95, 99, 100)``.
+
+    Returns
+    -------
+    dict
+        - ``"loading"`` : ``100 * |F| / fmax``, shape ``(L, T)``.
+        - ``"percentiles"`` : array of shape ``(L, len(q))``.
+        - ``"q"`` : the requested percentiles.
+        - ``"hours_above"`` : number of hours at or above 100 % per line.
+    """
+    line_data = data["map"]["line_data"]
+    fmax = np.array([float(line_data[ell]["fmax"]) for ell in arr["L"]])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        load = 100.0 * np.abs(arr["F"]) / fmax[:, None]
+    q = tuple(q)
+    pct = np.percentile(load, q, axis=1).T if load.size else np.zeros((len(fmax), len(q)))
+    return {
+        "loading": load,
+        "percentiles": pct,
+        "q": q,
+        "hours_above": (load >= 100.0 - 1e-9).sum(axis=1),
+    }
+
+def system_summary(out, data):
+    """
+    Compute every system-level summary of a solved case.
+
+    Parameters
+    ----------
+    out : dict
+        Results dictionary returned by `solve_case`.
+    data : dict
+        Case data loaded with `load_case`.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys ``"arrays"``, ``"bus_hour"``, ``"share"``,
+        ``"cost"`` (only when commitment and reserve results are present),
+        ``"reservoirs"`` and ``"lines"``.
+
+    Examples
+    --------
+    ``examples/case_tiny.yaml`` is infeasible as shipped (G2 is locked
+    off at t=1 and cannot cover the reserve requirement), so the example
+    solves a copy with ``init_status`` relaxed to -2:
+
+    >>> import yaml
+    >>> from pydessem.io_loader import load_case
+    >>> from pydessem.solve import solve_case
+    >>> from pydessem.reporting import system_summary
+    >>> data = load_case("examples/case_tiny.yaml")
+    >>> data["params"]["uc"]["init_status"]["G2"] = -2
+    >>> with open("case_tiny_ok.yaml", "w", encoding="utf-8") as f:
+    ...     yaml.safe_dump(data, f)
+    >>> out, m, data = solve_case("case_tiny_ok.yaml")
+    >>> summary = system_summary(out, data)
+    >>> sorted(summary)
+    ['arrays', 'bus_hour', 'cost', 'lines', 'reservoirs', 'share']
+    """
+    arr = result_arrays(out, data)
+    summary = {
+        "arrays": arr,
+        "bus_hour": bus_hour_totals(arr, data),
+        "share": hydro_thermal_share(arr),
+        "reservoirs": reservoir_trajectories(arr, data),
+        "lines": line_loading_percentiles(arr, data),
+    }
+    if all(k in arr for k in ("u", "y", "z", "Rg")):
+        summary["cost"] = cost_breakdown(arr, data)
+    return summary
+
+def downsample(y, max_points=500, how="mean"):
+    """
+    Aggregate the last (time) axis in blocks so it has at most `max_points`.
+
+    Parameters
+    ----------
+    y : array_like
+        Series of shape ``(..., T)``.
+    max_points : int, optional
+        Maximum number of points kept along the time axis. Default is 500.
+    how : {"mean", "max", "min"}, optional
+        Block reduction. Use ``"max"`` to keep peaks (e.g. line loading).
+
+    Returns
+    -------
+    tuple
+        (x, y_ds) where ``x`` holds the mean hour (1-based) of each block
+        and ``y_ds`` the reduced series. Short series are returned as is.
+    """
+    reducers = {"mean": np.nanmean, "max": np.nanmax, "min": np.nanmin}
+    if how not in reducers:
+        raise ValueError(f"Redução inválida: {how}")
+    y = np.asarray(y, dtype=float)
+    T = y.shape[-1]
+    x = np.arange(1, T + 1, dtype=float)
+    if T <= max_points:
+        return x, y
+    w = -(-T // max_points)
+    n = -(-T // w)
+    pad = n * w - T
+    if pad:
+        y = np.concatenate([y, np.full(y.shape[:-1] + (pad,), np.nan)], axis=-1)
+        x = np.concatenate([x, np.full(pad, np.nan)])
+    x_ds = np.nanmean(x.reshape(n, w), axis=-1)
+    y_ds = reducers[how](y.reshape(y.shape[:-1] + (n, w)), axis=-1)
+    return x_ds, y_ds
+
+def _axes(ax):
+    """Return `ax` or a new matplotlib axes (matplotlib is optional)."""
+    if ax is not None:
+        return ax
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise ImportError("matplotlib é necessário para os gráficos de relatório.") from exc
+    _, ax = plt.subplots()
+    return ax
+
+def plot_dispatch(arr, data, max_points=500, ax=None):
+    """
+    Plot stacked hydro, thermal and shed energy against system demand.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+    data : dict
+        Case data loaded with `load_case`.
+    max_points : int, optional
+        Maximum number of plotted points (see `downsample`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when omitted.
+
+    Returns
+    -------
+    matplotlib.axes.Axes
+    """
+    ax = _axes(ax)
+    share = hydro_thermal_share(arr)
+    demand = _demand_array(data, arr["B"], arr["T"]).sum(axis=0)
+    stack = np.vstack([share["hydro"], share["thermal"], arr["LS"].sum(axis=0), demand])
+    x, (h, t, ls, dem) = downsample(stack, max_points)
+    ax.stackplot(x, h, t, ls, labels=["Hidráulica", "Térmica", "Déficit"])
+    ax.plot(x, dem, "k--", label="Demanda")
+    ax.set_xlabel("Hora")
+    ax.set_ylabel("MW")
+    ax.legend()
+    return ax
+
+def plot_reservoirs(arr, data, max_points=500, ax=None):
+    """
+    Plot reservoir volume trajectories.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+    data : dict
+        Case data loaded with `load_case`.
+    max_points : int, optional
+        Maximum number of plotted points (see `downsample`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when omitted.
+
+    Returns
+    -------
+    matplotlib.axes.Axes
+    """
+    ax = _axes(ax)
+    vol = reservoir_trajectories(arr, data)["volume"]
+    x, v = downsample(vol, max_points)
+    for r, row in zip(arr["R"], v):
+        ax.plot(x - 1.0, row, label=str(r))
+    ax.set_xlabel("Hora")
+    ax.set_ylabel("Volume")
+    ax.legend()
+    return ax
+
+def plot_line_loading(arr, data, max_points=500, ax=None):
+    """
+    Plot the peak loading of each line, in percent of its limit.
+
+    Parameters
+    ----------
+    arr : dict
+        Arrays returned by `result_arrays`.
+    data : dict
+        Case data loaded with `load_case`.
+    max_points : int, optional
+        Maximum number of plotted points. Blocks keep their maximum
+        loading so that overloads are never hidden by downsampling.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created when omitted.
+
+    Returns
+    -------
+    matplotlib.axes.Axes
+    """
+    ax = _axes(ax)
+    load = line_loading_percentiles(arr, data, q=(100,))["loading"]
+    x, lv = downsample(load, max_points, how="max")
+    for ell, row in zip(arr["L"], lv):
+        ax.plot(x, row, label=str(ell))
+    ax.axhline(100.0, color="k", linestyle="--")
+    ax.set_xlabel("Hora")
+    ax.set_ylabel("Carregamento (%)")
+    ax.legend()
+    return ax
@@ -17,6 +17,7 @@ Augusto Mathias Adams <augusto.adams@ufpr.br>
 Contents
 --------
 - solve_case: load, build, solve, and return results.
+- collect_results: extract the result series of a solved model.
 
 Notes
 -----
@@ -52,7 +53,7 @@ def solve_case(path_yaml, solver_name="glpk"):
         (out, model, data)
         - out : dict
             Results including objective value and variable series
-            (generation, flows, volumes, reserves, etc.).
+            (generation, flows, volumes, reserves, commitment, etc.).
         - model : pyomo.environ.ConcreteModel
             The solved Pyomo model object.
         - data : dict
@@ -70,7 +71,25 @@ def solve_case(path_yaml, solver_name="glpk"):
     opt = SolverFactory(solver_name)
     res = opt.solve(m, tee=False)
 
-    out = {
+    out = collect_results(m)
+    return out, m, data
+
+def collect_results(m):
+    """
+    Extract the result series of a solved PyDessem model.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model built by `build_model` and already solved.
+
+    Returns
+    -------
+    dict
+        Objective value and variable series keyed by ``(index, t)``
+        (generation, flows, volumes, reserves, commitment, etc.).
+    """
+    return {
         "objective": float(value(m.OBJ)),
         "P": {(g,t): float(value(m.P[g,t])) for g in m.G for t in m.T},
         "LS": {(b,t): float(value(m.LS[b,t])) for b in m.B for t in m.T},
@@ -80,5 +99,7 @@ def solve_case(path_yaml, solver_name="glpk"):
         "Q_s": {(r,t): float(value(m.Q_s[r,t])) for r in m.R for t in m.T},
         "P_h": {(r,t): float(value(m.P_h[r,t])) for r in m.R for t in m.T},
         "R": {(g,t): float(value(m.Rg[g,t])) for g in m.GT for t in m.T},
+        "u": {(g,t): float(value(m.u[g,t])) for g in m.GT for t in m.T},
+        "y": {(g,t): float(value(m.y[g,t])) for g in m.GT for t in m.T},
+        "z": {(g,t): float(value(m.z[g,t])) for g in m.GT for t in m.T},
     }
-    return out, m, data
@@ -0,0 +1,123 @@
+import copy
+import numpy as np
+import pytest
+import yaml
+from pyomo.environ import SolverFactory, value
+from pyomo.repn import generate_standard_repn
+from pydessem.io_loader import load_case
+from pydessem.model_core import build_model
+from pydessem.contingency import (
+    network_factors, screen_n1, add_security_constraints, solve_n1
+)
+
+HAS_GLPK = SolverFactory("glpk").available(exception_flag=False)
+
+def _meshed_case():
+    data = load_case("examples/case_tiny.yaml")
+    data["sets"]["L"].append({"name": "L13", "i": "B1", "j": "B3"})
+    data["map"]["line_data"]["L13"] = {"b": 5.0, "fmax": 40.0}
+    return data
+
+def test_radial_outages_island():
+    fac = network_factors(load_case("examples/case_tiny.yaml"))
+    assert fac["islanding"].all()
+
+def test_lodf_matches_outage_flows():
+    data = _meshed_case()
+    fac = network_factors(data)
+    assert not fac["islanding"].any()
+    inj = np.array([30.0, -30.0, 0.0])
+    F = fac["ptdf"] @ inj
+    for k, name in enumerate(fac["lines"]):
+        post = copy.deepcopy(data)
+        post["sets"]["L"] = [ell for ell in post["sets"]["L"] if ell["name"] != name]
+        pf = network_factors(post)
+        expected = pf["ptdf"] @ inj
+        keep = [i for i in range(len(F)) if i != k]
+        assert np.allclose(F[keep] + fac["lodf"][keep, k]*F[k], expected)
+
+def test_screen_n1_chunked():
+    data = _meshed_case()
+    fac = network_factors(data)
+    T = int(data["meta"]["horizon_hours"])
+    inj = np.tile([[60.0], [-60.0], [0.0]], (1, T))
+    F = fac["ptdf"] @ inj
+    out = {"F": {(ell, t): F[i, t-1] for i, ell in enumerate(fac["lines"])
+                 for t in range(1, T+1)}}
+    full = screen_n1(out, data)
+    small = screen_n1(out, data, chunk_bytes=8)
+    assert full["checked"] == 3*3*T
+    assert len(full["hour"]) > 0
+    assert sorted(zip(full["monitored"], full["outage"], full["hour"])) == \
+        sorted(zip(small["monitored"], small["outage"], small["hour"]))
+    assert (np.abs(full["flow"]) > full["limit"]).all()
+
+def _n1_case(T=2):
+    # Triângulo: hidráulica barata em B1 atende 60 MW em B2. O despacho de
+    # mínimo custo viola fmax_n1 = 50 em qualquer contingência de linha.
+    lines = ["L12", "L13", "L23"]
+    return {
+        "meta": {"name": "triangle-n1", "horizon_hours": T, "base_mva": 100.0},
+        "sets": {
+            "B": ["B1", "B2", "B3"], "G": ["G1", "G2"],
+            "GH": ["G1"], "GT": ["G2"], "R": ["R1"],
+            "L": [{"name": "L12", "i": "B1", "j": "B2"},
+                  {"name": "L13", "i": "B1", "j": "B3"},
+                  {"name": "L23", "i": "B2", "j": "B3"}],
+        },
+        "map": {
+            "gen_bus": {"G1": "B1", "G2": "B2"},
+            "res_of_gen": {"G1": "R1"},
+            "line_data": {ell: {"b": 10.0, "fmax": 100.0, "fmax_n1": 50.0} for ell in lines},
+        },
+        "params": {
+            "demand": {"B1": [0.0]*T, "B2": [60.0]*T, "B3": [0.0]*T},
+            "therm_cost": {"G2": 100.0},
+            "g_min": {"G1": 0.0, "G2": 0.0},
+            "g_max": {"G1": 100.0, "G2": 100.0},
+            "ramp_up": {"G1": 9999, "G2": 9999},
+            "ramp_dn": {"G1": 9999, "G2": 9999},
+            "ref_bus": "B1",
+            "vol_min": {"R1": 0.0}, "vol_max": {"R1": 2000.0}, "vol0": {"R1": 1000.0},
+            "inflow": {"R1": [0.0]*T},
+            "q_min": {"R1": 0.0}, "q_max": {"R1": 100.0},
+            "hydro_pwl": {"R1": [{"q": 0, "p": 0}, {"q": 100, "p": 100}]},
+            "penalties": {"load_shed": 10000.0, "spill": 0.0},
+            "uc": {"u0": {"G2": 1}, "init_status": {"G2": 5}},
+        },
+    }
+
+def test_add_security_constraints_coefficients():
+    data = _n1_case()
+    fac = network_factors(data)
+    pos = {ell: k for k, ell in enumerate(fac["lines"])}
+    F = fac["ptdf"] @ np.tile([[60.0], [-60.0], [0.0]], (1, 2))
+    out = {"F": {(ell, t): F[i, t-1] for i, ell in enumerate(fac["lines"])
+                 for t in (1, 2)}}
+    report = screen_n1(out, data)
+    assert len(report["hour"]) == 8
+
+    m = build_model(data)
+    n = add_security_constraints(m, data, report)
+    assert n == len(m.SecurityN1) == 8
+    rows = zip(report["monitored"], report["outage"], report["hour"], report["limit"])
+    for i, (ell, k, t, lim) in enumerate(rows, start=1):
+        con = m.SecurityN1[i]
+        repn = generate_standard_repn(con.body)
+        coefs = {id(v): c for v, c in zip(repn.linear_vars, repn.linear_coefs)}
+        assert np.isclose(coefs[id(m.F[ell, int(t)])], 1.0)
+        assert np.isclose(coefs[id(m.F[k, int(t)])], fac["lodf"][pos[ell], pos[k]])
+        assert np.isclose(value(con.upper), lim)
+        assert np.isclose(value(con.lower), -lim)
+
+@pytest.mark.skipif(not HAS_GLPK, reason="glpk não disponível")
+def test_solve_n1_enforces_security(tmp_path):
+    path = tmp_path / "case_n1.yaml"
+    path.write_text(yaml.safe_dump(_n1_case()), encoding="utf-8")
+    out, m, data, report = solve_n1(str(path), solver_name="glpk")
+    assert report["iterations"] >= 1
+    assert report["converged"]
+    assert len(report["hour"]) == 0
+    assert report["islanding"] == []
+    assert len(m.SecurityN1) > 0
+    assert all(out["P"][("G1", t)] <= 50.0 + 1e-6 for t in (1, 2))
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+import yaml
+from pyomo.environ import SolverFactory
+from pydessem.io_loader import load_case
+from pydessem.solve import solve_case
+from pydessem.reporting import (
+    series_to_array, result_arrays, bus_hour_totals,
+    hydro_thermal_share, cost_breakdown, line_loading_percentiles,
+    reservoir_trajectories, system_summary, downsample
+)
+
+HAS_GLPK = SolverFactory("glpk").available(exception_flag=False)
+
+def _fake_out(data):
+    T = int(data["meta"]["horizon_hours"])
+    hours = range(1, T+1)
+    return {
+        "P": {**{("G1", t): 40.0 for t in hours}, **{("G2", t): 20.0 for t in hours}},
+        "LS": {(b, t): 0.0 for b in data["sets"]["B"] for t in hours},
+        "F": {**{("L12", t): 20.0 for t in hours}, **{("L23", t): -80.0 for t in hours}},
+        "V": {("R1", t): 120.0 - 10.0*t for t in hours},
+        "Q_t": {("R1", t): 12.0 for t in hours},
+        "Q_s": {("R1", t): 0.0 for t in hours},
+        "P_h": {("R1", t): 40.0 for t in hours},
+        "R": {("G2", t): 10.0 for t in hours},
+        "u": {("G2", t): 1.0 for t in hours},
+        "y": {("G2", t): 1.0 if t == 1 else 0.0 for t in hours},
+        "z": {("G2", t): 0.0 for t in hours},
+    }
+
+def test_series_to_array_unordered():
+    arr = series_to_array({("B", 2): 3.0, ("A", 1): 1.0}, ["A", "B"], 2)
+    assert np.array_equal(arr, [[1.0, 0.0], [0.0, 3.0]])
+
+def test_series_to_array_rejects_out_of_range_hours():
+    for t in (0, 3):
+        with pytest.raises(ValueError):
+            series_to_array({("A", t): 1.0}, ["A"], 2)
+
+def test_system_summaries():
+    data = load_case("examples/case_tiny.yaml")
+    arr = result_arrays(_fake_out(data), data)
+
+    bus = bus_hour_totals(arr, data)
+    assert bus["generation"].shape == (3, 6)
+    assert np.allclose(bus["system"]["generation"], 60.0)
+
+    share = hydro_thermal_share(arr)
+    assert np.isclose(share["total"]["hydro_share"], 2.0/3.0)
+
+    cost = cost_breakdown(arr, data)
+    assert np.isclose(cost["total"]["variable"], 120.0*20.0*6)
+    assert np.isclose(cost["total"]["startup"], 2000.0)
+    assert np.isclose(cost["objective"], sum(cost["total"].values()))
+
+    res = reservoir_trajectories(arr, data)
+    assert res["volume"].shape == (1, 7)
+    assert np.isclose(res["delta"][0], -60.0)
+
+    lines = line_loading_percentiles(arr, data, q=(100,))
+    assert np.allclose(lines["percentiles"][:, 0], [20.0, 100.0])
+    assert lines["hours_above"].tolist() == [0, 6]
+
+def test_system_summary_full_output():
+    data = load_case("examples/case_tiny.yaml")
+    summary = system_summary(_fake_out(data), data)
+    assert summary["arrays"]["R"] == ["R1"]
+    assert summary["arrays"]["Rg"].shape == (1, 6)
+    assert summary["reservoirs"]["volume"].shape == (1, 7)
+    assert np.isclose(summary["cost"]["total"]["reserve"], 30.0*10.0*6)
+
+@pytest.mark.skipif(not HAS_GLPK, reason="glpk não disponível")
+def test_cost_breakdown_matches_objective(tmp_path):
+    # init_status -1 com min_down_time 2 trava G2 desligada em t=1 e deixa o
+    # requisito de reserva inviável; -2 libera a partida já em t=1
+    data = load_case("examples/case_tiny.yaml")
+    data["params"]["uc"]["init_status"]["G2"] = -2
+    path = tmp_path / "case.yaml"
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    out, m, data = solve_case(str(path), solver_name="glpk")
+    cost = system_summary(out, data)["cost"]
+    assert np.isclose(cost["objective"], out["objective"], rtol=1e-6, atol=1e-6)
+
+def test_downsample_keeps_peaks():
+    y = np.zeros(1000)
+    y[537] = 5.0
+    x, yd = downsample(y, max_points=100, how="max")
+    assert len(x) == len(yd) <= 100
+    assert yd.max() == 5.0